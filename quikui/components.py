@@ -1,10 +1,12 @@
 import string
-from collections.abc import Container
+from collections.abc import Container, Sequence
+from collections.abc import Set as AbstractSet
 from enum import Enum
 from functools import cache
 from itertools import chain
+from types import NoneType, UnionType
 from typing import (Annotated, Any, Callable, ClassVar, Dict, Iterator, List,
-                    Literal, Self, Set)
+                    Literal, Self, Set, Union, get_args, get_origin)
 
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
@@ -16,16 +18,89 @@ from pydantic import (BaseModel, ConfigDict, Field, RootModel, ValidationError,
 from pydantic.fields import FieldInfo
 
 from .exceptions import NoTemplateFound
-from .utils import unflatten
+from .utils import get_template_name, unflatten
 
 # NOTE: https://html.spec.whatwg.org/multipage/syntax.html#attributes-2
 VALID_ATTR_CHARS = set(string.printable) - set(""" "'`<>/=""")
 
+# NOTE: Field annotations which can be populated by repeated form fields (except `str`/`bytes`)
+MULTI_VALUE_TYPES = (Sequence, AbstractSet)
+
 
 def is_component(value: Any) -> bool:
     return isinstance(value, BaseComponent)
 
 
+def is_multi_value_annotation(annotation: Any) -> bool:
+    """
+    Whether a field with type ``annotation`` accepts a sequence of values, including when it is
+    optional (e.g. ``list[str] | None``) or an abstract type (e.g. ``Sequence[str]``).
+    """
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return any(
+            is_multi_value_annotation(arg) for arg in get_args(annotation) if arg is not NoneType
+        )
+
+    elif origin is Annotated:
+        return is_multi_value_annotation(get_args(annotation)[0])
+
+    origin = origin or annotation
+    return (
+        isinstance(origin, type)
+        and issubclass(origin, MULTI_VALUE_TYPES)
+        and not issubclass(origin, (str, bytes))
+    )
+
+
+def create_environment(package_name: str, package_path: str) -> Environment:
+    """
+    Create an environment to search for templates in the package resource ``package_path`` of
+    the package named ``package_name``.
+
+    Returns:
+        :class:`~jinja2.Environment`: The environment to search for template(s) with.
+    """
+    env = Environment(
+        loader=PackageLoader(package_name=package_name, package_path=package_path),
+        autoescape=True,
+    )
+    # NOTE: Add our special filters here
+    env.filters.update({"is_component": is_component})
+    return env
+
+
+@cache
+def get_environment(package_name: str, package_path: str) -> Environment:
+    """
+    The environment shared by every component that searches for templates in the package resource
+    ``package_path`` of the package named ``package_name``.
+
+    Returns:
+        :class:`~jinja2.Environment`: The environment to search for template(s) with.
+
+    ```{note}
+    This function is cached since environments will typically not change during runtime.
+    ```
+    """
+    return create_environment(package_name, package_path)
+
+
+@cache
+def get_class_environment(cls: type, package_name: str, package_path: str) -> Environment:
+    """
+    The environment used only by ``cls``, for classes that customize their environment.
+
+    Returns:
+        :class:`~jinja2.Environment`: The environment to search for template(s) with.
+
+    ```{note}
+    This function is cached since environments will typically not change during runtime.
+    ```
+    """
+    return create_environment(package_name, package_path)
+
+
 class CssClasses(RootModel):
     root: Set[str] = {}
 
@@ -177,7 +252,6 @@ class BaseComponent(BaseModel):
         return self
 
     @classmethod
-    @cache
     def quikui_environment(cls) -> Environment:
         """
         The environment to search for templates for this class and all it's subclasses.
@@ -187,19 +261,20 @@ class BaseComponent(BaseModel):
                 The environment to search for template(s) to render this class with.
 
         ```{note}
-        This method is cached since environments will typically not change during runtime.
+        If no class in the heirarchy overrides this method, the environment is shared by every
+        class using the same template package and path. Otherwise, each class gets its own cached
+        environment, so an override can safely customize what ``super().quikui_environment()``
+        returns (e.g. add globals or filters) without affecting any other component.
         ```
         """
-        env = Environment(
-            loader=PackageLoader(
-                package_name=cls.quikui_template_package_name,
-                package_path=cls.quikui_template_package_path,
-            ),
-            autoescape=True,
-        )
-        # NOTE: Add our special filters here
-        env.filters.update({"is_component": is_component})
-        return env
+        package_name = cls.quikui_template_package_name
+        package_path = cls.quikui_template_package_path
+
+        if cls.quikui_environment.__func__ is BaseComponent.quikui_environment.__func__:
+            return get_environment(package_name, package_path)
+
+        # NOTE: Overrides may customize the environment, so don't hand them the shared one
+        return get_class_environment(cls, package_name, package_path)
 
     @classmethod
     def quikui_template(cls, template_variant: str | None = None) -> Template:
@@ -234,9 +309,7 @@ class BaseComponent(BaseModel):
 
             try:
                 return env.get_template(
-                    f"{template_class.__name__}.{template_variant}.html"
-                    if template_variant
-                    else f"{template_class.__name__}.html"
+                    get_template_name(template_class.__name__, template_variant)
                 )
 
             except Jinja2TemplateNotFound:
@@ -678,10 +751,27 @@ class FormModel(BaseModel):
             items=list(cls.create_form_items(add_reset=add_reset)),
         )
 
+    @classmethod
+    @cache
+    def multi_value_fields(cls) -> frozenset[str]:
+        """
+        The fields of this model which accept a sequence of values (e.g. a checkbox group), and
+        therefore should collect every submitted value of that field from the form.
+
+        ```{note}
+        This method is cached since model fields do not change during runtime.
+        ```
+        """
+        return frozenset(
+            field_name
+            for field_name, field_info in cls.model_fields.items()
+            if is_multi_value_annotation(field_info.annotation)
+        )
+
     @classmethod
     async def as_form(cls, request: Request) -> Self:
         async with request.form() as form_data:
-            model_data = unflatten(form_data)
+            model_data = unflatten(form_data, multi_value_fields=cls.multi_value_fields())
 
         try:
             return cls.model_validate(model_data)
@@ -1,4 +1,4 @@
-from functools import wraps, partial
+from functools import singledispatch, wraps
 import inspect
 from typing import (
     Annotated,
@@ -17,10 +17,123 @@ from jinja2 import Template, Environment
 from pydantic import BaseModel
 
 from .components import BaseComponent, Div
-from .dependencies import QkVariant, RequestIfHtmlResponseNeeded
-from .exceptions import HtmlResponseOnly, ResponseNotRenderable
+from .dependencies import HtmlRequestRequired, QkVariant, RequestIfHtmlResponseNeeded
+from .exceptions import ResponseNotRenderable
 from .types import P, T, MaybeAsyncFunc, FastApiHandler, FastApiDecorator
-from .utils import append_to_signature, execute_maybe_sync_func, get_response
+from .utils import (
+    append_to_signature,
+    get_response,
+    get_response_param_names,
+    make_runner,
+)
+
+# NOTE: Parameters are immutable, so they can be shared by every decorated handler
+HTML_REQUEST_PARAMETER = inspect.Parameter(
+    "__html_request",
+    inspect.Parameter.KEYWORD_ONLY,
+    annotation=RequestIfHtmlResponseNeeded,
+)
+HTML_ONLY_REQUEST_PARAMETER = HTML_REQUEST_PARAMETER.replace(annotation=HtmlRequestRequired)
+QK_VARIANT_PARAMETER = inspect.Parameter(
+    "qk_variant",
+    inspect.Parameter.KEYWORD_ONLY,
+    annotation=QkVariant,
+    default=None,
+)
+
+
+def _render_with_template(
+    template: Template, item: BaseModel | dict, render_context: dict
+) -> str:
+    return template.render(
+        **(item.model_dump() if isinstance(item, BaseModel) else item),
+        **render_context,
+    )
+
+
+@singledispatch
+def _render_result(
+    result: Any,
+    *,
+    template: Template | None,
+    render_context: dict,
+    wrapper: Callable[..., BaseComponent],
+    wrapper_kwargs: dict,
+    template_variant: str | None,
+) -> str:
+    """
+    Render the result of a handler to HTML, dispatching on the type of ``result``.
+
+    Raises:
+        :class:`~quikui.ResponseNotRenderable`: If ``result`` is not a renderable type.
+    """
+    # NOTE: Should not happen if library is used properly
+    raise ResponseNotRenderable(result)
+
+
+@_render_result.register
+def _(result: str, **kwargs) -> str:
+    return result  # NOTE: `result` is assumed to be HTML str (could be unsafe)
+
+
+@_render_result.register(dict)
+@_render_result.register(BaseModel)
+def _(result, *, template: Template | None, render_context: dict, **kwargs) -> str:
+    if template is None:
+        raise ResponseNotRenderable(result)
+
+    return _render_with_template(template, result, render_context)
+
+
+@_render_result.register
+def _(
+    result: BaseComponent,
+    *,
+    template: Template | None,
+    render_context: dict,
+    template_variant: str | None,
+    **kwargs,
+) -> str:
+    if template is not None:
+        return _render_with_template(template, result, render_context)
+
+    return result.model_dump_html(
+        template_variant=template_variant,
+        render_context=render_context,
+    )
+
+
+@_render_result.register(list)
+@_render_result.register(tuple)
+def _(
+    result,
+    *,
+    template: Template | None,
+    render_context: dict,
+    wrapper: Callable[..., BaseComponent],
+    wrapper_kwargs: dict,
+    template_variant: str | None,
+) -> str:
+    # NOTE: Every item must be checked, since mixed sequences are either rendered differently
+    #       (e.g. components and strs with a template) or are not renderable at all
+    if template and all(isinstance(r, (BaseModel, dict)) for r in result):
+        items = [_render_with_template(template, r, render_context) for r in result]
+
+    elif all(isinstance(r, (BaseComponent, str)) for r in result):
+        items = result
+
+    else:
+        raise ResponseNotRenderable(result)
+
+    # NOTE: The wrapped result is rendered by itself, not with `template`
+    return _render_result(
+        wrapper(*items, **wrapper_kwargs),
+        template=None,
+        render_context=render_context,
+        wrapper=wrapper,
+        wrapper_kwargs=wrapper_kwargs,
+        template_variant=template_variant,
+    )
 
 
 def render_component(
@@ -48,6 +161,8 @@ def render_component(
         env (:class:`~jinja2.Environment` | :class:`~fastapi.templating.Jinja2Templates` | None):
             The template environment that should be used to dynamically fetch a template to render
             with. Only is required if `template=` kwarg is a string value (the name of a template).
+            If ``auto_reload`` is disabled on the :class:`~jinja2.Environment`, the template is
+            only fetched once. ``auto_reload`` is read once, when the decorator is applied.
 
         wrapper:
             Function to use to wrap a sequence (e.g. ``list``) returned from a handler to
@@ -90,13 +205,34 @@ def render_component(
     ```
     """
 
+    # NOTE: Resolve defaults here so it is not done on every request
+    wrapper = wrapper or Div
+    wrapper_kwargs = wrapper_kwargs or {}
+
     # NOTE: We must create a getter for the template so that it is dynamically fetched when needed
     if isinstance(template, str):
         if env is None:
             raise AssertionError("`env=` must be set if `template=` is a str.")
 
-        def get_template():
-            return env.get_template(template)
+        if isinstance(env, Jinja2Templates):
+            env = env.env
+
+        # NOTE: Only a jinja `Environment` is known to not reload templates if `auto_reload` is off
+        if not isinstance(env, Environment) or env.auto_reload:
+
+            def get_template():
+                return env.get_template(template)
+
+        else:
+            # NOTE: Templates will never be reloaded, so only fetch it once (on first request)
+            cached_template: Template | None = None
+
+            def get_template():
+                nonlocal cached_template
+                if cached_template is None:
+                    cached_template = env.get_template(template)
+
+                return cached_template
 
     else:
 
@@ -104,6 +240,12 @@ def render_component(
             return template  # type is `Template | None`
 
     def decorator(func: MaybeAsyncFunc[P, T]) -> FastApiHandler:
+        # NOTE: `func` never changes, so decide how to execute it once (not on every request)
+        execute_func = make_runner(func)
+
+        # NOTE: FastAPI only injects a `Response` into `kwargs` if the handler asks for one
+        response_param_names = get_response_param_names(func)
+
         @wraps(func)
         async def wrapper_render_if_html_requested(
             *args: P.args,
@@ -111,10 +253,7 @@ def render_component(
             qk_variant: QkVariant = None,
             **kwargs: P.kwargs,
         ) -> T | Response:
-            if html_only and __html_request is None:
-                raise HtmlResponseOnly()
-
-            result = await execute_maybe_sync_func(func, *args, **kwargs)
+            result = await execute_func(*args, **kwargs)
             # NOTE: Short-circut to return response directly if our heuristic fails,
             #       or a user decides to return a direct Response object (bypassing our logic)
             if __html_request is None or isinstance(result, Response):
@@ -122,52 +261,18 @@ def render_component(
 
             # NOTE: Dependency resolves to a `Request` if we've made it this far
             request = __html_request
-            if (response_template := get_template()) and isinstance(result, (BaseModel, dict)):
-                result = response_template.render(
-                    **(result.model_dump() if isinstance(result, BaseModel) else result),
-                    request=request,
-                    url_for=request.url_for,
-                )
-
-            elif (
-                response_template
-                and isinstance(result, (tuple, list))
-                and all(isinstance(r, (BaseModel, dict)) for r in result)
-            ):
-                result = (wrapper if wrapper else Div)(  # type: ignore[operator]
-                    *(
-                        response_template.render(
-                            **(r.model_dump() if isinstance(r, BaseModel) else r),
-                            request=request,
-                            url_for=request.url_for,
-                        )
-                        for r in result
-                    ),
-                    **(wrapper_kwargs or {}),
-                )
-
-            elif isinstance(result, (tuple, list)) and all(
-                isinstance(r, (BaseComponent, str)) for r in result
-            ):
-                result = (wrapper if wrapper else Div)(  # type: ignore[operator]
-                    *result,
-                    **(wrapper_kwargs or {}),
-                )
-
-            elif not isinstance(result, (BaseComponent, str)):
-                # NOTE: Should not happen if library is used properly
-                raise ResponseNotRenderable(result)
-
-            # NOTE: Needs `result` after processing
-            if isinstance(result, BaseComponent):
-                result = result.model_dump_html(  # type: ignore[assignment]
-                    template_variant=qk_variant,
-                    render_context=dict(request=request, url_for=request.url_for),
-                )
-
-            # else: `result` is assumed to be HTML str now (NOTE: could be unsafe)
-
-            if response := get_response(kwargs):
+            # NOTE: Only read by rendering, so it is safe to share for the whole response
+            render_context = dict(request=request, url_for=request.url_for)
+            result = _render_result(
+                result,
+                template=get_template(),
+                render_context=render_context,
+                wrapper=wrapper,
+                wrapper_kwargs=wrapper_kwargs,
+                template_variant=qk_variant,
+            )
+
+            if response := get_response(kwargs, response_param_names):
                 return HTMLResponse(result, headers=response.headers)
 
             else:
@@ -176,17 +281,9 @@ def render_component(
         # NOTE: Ensure our html response detection dependency is included
         return append_to_signature(
             wrapper_render_if_html_requested,
-            inspect.Parameter(
-                "__html_request",
-                inspect.Parameter.KEYWORD_ONLY,
-                annotation=RequestIfHtmlResponseNeeded,
-            ),
-            inspect.Parameter(
-                "qk_variant",
-                inspect.Parameter.KEYWORD_ONLY,
-                annotation=QkVariant,
-                default=None,
-            ),
+            # NOTE: If `html_only=True`, the dependency raises before the handler is ever called
+            HTML_ONLY_REQUEST_PARAMETER if html_only else HTML_REQUEST_PARAMETER,
+            QK_VARIANT_PARAMETER,
         )
 
     return decorator
@@ -1,19 +1,43 @@
+import re
+from functools import lru_cache
 from typing import Annotated
 from pydantic import BaseModel, ValidationError
 from fastapi import Request, Depends, Header
 
+from .exceptions import HtmlResponseOnly
+
 
 # HTMX Headers
 HxRequest = Annotated[bool, Header(include_in_schema=False)]
 # QuikUI Headers (this library)
 QkVariant = Annotated[str | None, Header(include_in_schema=False)]
 
+# NOTE: Content type of requests that should get a JSON response back
+JSON_CONTENT_TYPE = "application/json"
+# NOTE: Media types in an `Accept` header that mean an HTML response can be given
+HTML_MEDIA_TYPES = ("text/html", "application/xhtml+xml")
+# NOTE: Matches any media range in an `Accept` header that starts with one of the above
+ACCEPT_HTML = re.compile(r"(?:^|,)\s*(?:%s)" % "|".join(map(re.escape, HTML_MEDIA_TYPES)))
+
+
+@lru_cache(maxsize=256)
+def is_html_accepted(accept: str | None) -> bool:
+    """
+    Whether an ``Accept`` header value allows an HTML response to be given.
+
+    Returns:
+        (bool): Whether any media range in ``accept`` is an HTML media type.
+
+    ```{note}
+    This function is cached since only a handful of distinct header values are seen in practice.
+    ```
+    """
+    return accept is not None and ACCEPT_HTML.search(accept) is not None
 
-def request_if_html_response_needed(
+
+async def request_if_html_response_needed(
     request: Request,
     # Header fields to detect with
-    accept: Annotated[str | None, Header(include_in_schema=False)] = None,
-    content_type: Annotated[str | None, Header(include_in_schema=False)] = None,
     hx_request: HxRequest = False,
     qk_variant: QkVariant = None,
 ) -> Request | None:
@@ -29,17 +53,37 @@ def request_if_html_response_needed(
         # We definitely know if any of these headers are present, it means respond w/ html
         return request
 
-    elif content_type == "application/json":
+    # NOTE: Only read these headers when needed, instead of having FastAPI parse them every time
+    headers = request.headers
+    if headers.get("content-type") == JSON_CONTENT_TYPE:
         # Assume that if the request is JSON, the response should be too
         # NOTE: htmx never does this
         return None
 
-    elif accept is not None and (accepted_types := list(t.strip() for t in accept.split(","))):
-        if any(t.startswith("text/html") for t in accepted_types):
-            return request  # We have determined this is expecting HTML back
+    elif is_html_accepted(headers.get("accept")):
+        return request  # We have determined this is expecting HTML back
 
     # else: We haven't determined (according to above heuristics) that HTML is requested
     return None
 
 
 RequestIfHtmlResponseNeeded = Annotated[Request | None, Depends(request_if_html_response_needed)]
+
+
+async def require_html_request(request: RequestIfHtmlResponseNeeded) -> Request:
+    """
+    FastAPI dependency that rejects ``request`` if it does not expect an ``HTMLResponse``.
+
+    Returns:
+        (Request): the request it was given, if the detection triggers.
+
+    Raises:
+        :class:`~quikui.HtmlResponseOnly`: A 406 error if an HTML response was not detected.
+    """
+    if request is None:
+        raise HtmlResponseOnly()
+
+    return request
+
+
+HtmlRequestRequired = Annotated[Request, Depends(require_html_request)]
@@ -1,6 +1,8 @@
 from fastapi import HTTPException, status
 from typing import Any, Type
 
+from .utils import get_template_name
+
 
 class BaseException(Exception):
     pass
@@ -8,11 +10,7 @@ class BaseException(Exception):
 
 class NoTemplateFound(BaseException, RuntimeError):
     def __init__(self, cls: Type, template_variant: str | None):
-        if template_variant:
-            template_name = f"{cls.__name__}.{template_variant}.html"
-        else:
-            template_name = f"{cls.__name__}.html"
-
+        template_name = get_template_name(cls.__name__, template_variant)
         super().__init__(
             f"Component '{cls.__name__}' does not contain an environment with a template "
             f"named '{template_name}' in it, or subclass another component that can render itself."
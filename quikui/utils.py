@@ -1,10 +1,12 @@
 import inspect
 from asyncio import iscoroutinefunction
-from collections.abc import Callable, Mapping
-from typing import (Any, cast)
+from collections.abc import Callable, Container, Iterable, Mapping
+from functools import partial
+from typing import (Annotated, Any, Coroutine, cast, get_args, get_origin)
 
 from fastapi import Response
 from fastapi.concurrency import run_in_threadpool
+from fastapi.dependencies.utils import get_typed_signature
 from starlette.datastructures import FormData
 
 from .types import MaybeAsyncFunc, P, T
@@ -33,37 +35,92 @@ def append_to_signature(func: Callable, *params: inspect.Parameter) -> Callable:
     return func
 
 
-async def execute_maybe_sync_func(
-    func: MaybeAsyncFunc[P, T], *args: P.args, **kwargs: P.kwargs
-) -> T:
+def make_runner(func: MaybeAsyncFunc[P, T]) -> Callable[P, Coroutine[Any, Any, T]]:
     """
-    Executes the given function in a thread if it's a sync one, or in the current asyncio
-    event loop if it's an async one.
+    Returns an async callable that executes the given function in a thread if it's a sync one,
+    or in the current asyncio event loop if it's an async one.
 
     Arguments:
         func: The function to execute.
-        *args: Positional arguments to pass to the function.
-        **kwargs: Keyword arguments to pass to the function.
+
+    Returns:
+        An async callable taking the same arguments as `func`. The sync/async check is done once
+        here, so the returned callable can be awaited on every request without re-checking it.
     """
     if iscoroutinefunction(func):
-        return await func(*args, **kwargs)  # type: ignore[no-any-return]
+        return func  # type: ignore[return-value]
+
+    return partial(run_in_threadpool, cast(Callable[P, T], func))
+
+
+def get_response_param_names(func: Callable) -> tuple[str, ...]:
+    """
+    Returns the names of the parameters of `func` that are annotated as a `Response`, either
+    directly or via ``Annotated[Response, ...]`` (e.g. a dependency that returns a `Response`).
 
-    return await run_in_threadpool(cast(Callable[P, T], func), *args, **kwargs)
+    Arguments:
+        func: The handler function whose signature should be inspected.
+    """
+    names = []
+    for param in get_typed_signature(func).parameters.values():
+        annotation = param.annotation
+        if get_origin(annotation) is Annotated:
+            annotation = get_args(annotation)[0]
+
+        if isinstance(annotation, type) and issubclass(annotation, Response):
+            names.append(param.name)
 
+    return tuple(names)
 
-def get_response(kwargs: Mapping[str, Any]) -> Response | None:
+
+def get_response(kwargs: Mapping[str, Any], names: Iterable[str]) -> Response | None:
     """
-    Returns the first `Response` instance from the values in `kwargs` (if there is one).
+    Returns the first `Response` instance from `kwargs` under one of `names` (if there is one).
 
     Arguments:
         kwargs: The keyword arguments from which the `Response` should be returned.
+        names: The names of the keyword arguments which may contain the `Response`, typically
+            computed once using :func:`get_response_param_names`.
     """
-    for val in kwargs.values():
-        if isinstance(val, Response):
+    for name in names:
+        if (val := kwargs.get(name)) is not None:
             return val
 
     return None
 
 
-def unflatten(form_data: FormData) -> dict:
-    return {key: value for key, value in form_data.items()}
+def get_template_name(class_name: str, template_variant: str | None = None) -> str:
+    """
+    Returns the name of the template used to render a class named `class_name`.
+
+    Arguments:
+        class_name: The name of the class to render.
+        template_variant: The template variant (file extension prepend) to use, if any.
+    """
+    if template_variant:
+        return f"{class_name}.{template_variant}.html"
+
+    return f"{class_name}.html"
+
+
+def unflatten(form_data: FormData, multi_value_fields: Container[str] = ()) -> dict:
+    """
+    Convert `form_data` into a dict that can be validated by a model.
+
+    Arguments:
+        form_data: The submitted form data.
+        multi_value_fields: The fields which should collect all of their submitted values into a
+            list (e.g. a checkbox group), instead of only keeping the last value.
+    """
+    if not multi_value_fields:
+        return dict(form_data)
+
+    model_data: dict = {}
+    for key, value in form_data.multi_items():
+        if key in multi_value_fields:
+            model_data.setdefault(key, []).append(value)
+
+        else:
+            model_data[key] = value
+
+    return model_data
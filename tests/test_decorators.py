@@ -0,0 +1,41 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+import quikui as qk
+
+
+def set_header(response: Response) -> Response:
+    response.headers["x-dep"] = "1"
+    return response
+
+
+app = FastAPI()
+
+
+@app.get("/plain")
+@qk.render_component()
+def plain(response: Response):
+    response.headers["x-dep"] = "1"
+    return qk.Paragraph("plain")
+
+
+@app.get("/annotated")
+@qk.render_component()
+def annotated(response: Annotated[Response, Depends(set_header)]):
+    return qk.Paragraph("annotated")
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/plain", "/annotated"])
+def test_response_headers_forwarded_to_html(client, path):
+    response = client.get(path, headers={"accept": "text/html"})
+    assert response.status_code == 200
+    assert response.text == f"<p>{path[1:]}</p>"
+    assert response.headers["x-dep"] == "1"